@@ -12,13 +12,26 @@ name and renders the next N school days using the Jinja template in
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
+import os
 import re
+import string
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-import requests
+try:  # Optional: faster and lighter than stdlib json for GraphQL payloads
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from plugins.base_plugin.base_plugin import BasePlugin
 
@@ -42,12 +55,40 @@ MAX_DAYS = 5
 PENDING_TEXT = "Not yet published"
 NO_MENU_TEXT = "No menu available"
 
+# Published menus change at most daily and menuType ids are stable, so both
+# are cached on disk between renders. The directory is per user (not under the
+# shared temp dir) so other local users cannot plant entries.
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "inkypi-schoolmenu"
+)
+MENU_CACHE_TTL = 6 * 60 * 60
+MENU_TYPES_CACHE_TTL = 24 * 60 * 60
+MENU_ITEMS_SELECTION = "items { day product { name } }"
+
+
+_WS_RE = re.compile(r"\s+")
+# Lowercases ASCII letters and maps every non-space ASCII whitespace
+# character to " " in a single pass.
+_ASCII_WS = "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f"
+_ASCII_NORMALIZE_TABLE = str.maketrans(
+    string.ascii_uppercase + _ASCII_WS, string.ascii_lowercase + " " * len(_ASCII_WS)
+)
+
 
 # Items that are considered boilerplate / ubiquitous accompaniments and should
 # be hidden from the rendered menu. These are matched on a normalized (lower
 # case, collapsed whitespace) exact basis. Expand this list as needed.
 def _normalize_name(name: str) -> str:
-    return re.sub(r"\s+", " ", name.strip().lower())
+    s = name.strip()
+    if s.isascii():
+        s = s.translate(_ASCII_NORMALIZE_TABLE)
+        return s if "  " not in s else _WS_RE.sub(" ", s)
+    s = s.lower()
+    # Every whitespace character other than " " is non-printable, so most names
+    # can skip the regex entirely.
+    if "  " not in s and s.isprintable():
+        return s
+    return _WS_RE.sub(" ", s)
 
 
 COMMON_MENU_ITEM_FILTER = {
@@ -56,7 +97,7 @@ COMMON_MENU_ITEM_FILTER = {
     "straus organic 1% milk",
     "non-fat milk",
 }
-COMMON_MENU_ITEM_FILTER = {_normalize_name(item) for item in COMMON_MENU_ITEM_FILTER}
+COMMON_MENU_ITEM_FILTER = frozenset(_normalize_name(item) for item in COMMON_MENU_ITEM_FILTER)
 
 
 # ---------------------------------------------------------------------------
@@ -66,79 +107,185 @@ class GraphQLError(RuntimeError):
     pass
 
 
-def _post_graphql(query: str) -> dict:
-    headers = {"Content-Type": "application/json"}
-    body = {"query": query}
-    resp = requests.post(GQL_ENDPOINT, json=body, headers=headers, timeout=30)
-    resp.raise_for_status()
-    payload = resp.json()
+@functools.lru_cache(maxsize=None)
+def _session():
+    """Return the shared keep-alive session, importing requests on first use."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2,
+            # Queries are read-only, so retrying a POST on a transient 5xx is
+            # safe; read timeouts are not retried (one 30 s wait, not several).
+            max_retries=Retry(
+                total=3,
+                connect=1,
+                read=0,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"POST"}),
+            ),
+        ),
+    )
+    return session
+
+
+def _decode(resp) -> Any:
+    """Parse a response body, with orjson when it is installed."""
+    return orjson.loads(resp.content) if orjson else resp.json()
+
+
+def _graphql_data(payload: dict) -> dict:
     if "errors" in payload:
         raise GraphQLError(str(payload["errors"]))
     return payload.get("data", {})
 
 
-def _validate_site_in_district(district_id: str, school_id: str) -> None:
-    """Raise ValueError if the school_id is not part of the district.
+def _gql_str(value: str) -> str:
+    """Quote ``value`` as a GraphQL string literal.
+
+    JSON string escaping is a subset of GraphQL's, so quotes or backslashes in
+    user settings cannot change the shape of the query.
+    """
+    return json.dumps(str(value))
+
+
+def _post_graphql(query: str) -> dict:
+    resp = _session().post(GQL_ENDPOINT, json={"query": query}, timeout=30)
+    resp.raise_for_status()
+    return _graphql_data(_decode(resp))
+
+
+def _post_graphql_batch(queries: List[str]) -> List[dict]:
+    """POST several queries as one batched request.
 
-    Uses a lightweight query that enumerates top-level sites for the org.
+    Returns the ``data`` payloads in the same order as ``queries``. If the
+    server does not accept batched arrays the queries (which are independent)
+    are sent as concurrent single requests instead.
     """
-    query = f'{{  organization(id:"{district_id}") {{ id name sites {{ id name }} }}}}'
-    data = _post_graphql(query).get("organization")
+    if len(queries) == 1:
+        return [_post_graphql(queries[0])]
+
+    body = [{"query": query} for query in queries]
+    resp = _session().post(GQL_ENDPOINT, json=body, timeout=30)
+    try:
+        payloads = _decode(resp) if resp.ok else None
+    except ValueError:  # includes orjson.JSONDecodeError
+        payloads = None
+    if isinstance(payloads, list) and len(payloads) == len(queries):
+        return [_graphql_data(payload) for payload in payloads]
+
+    logger.debug("Batched GraphQL request not supported; sending queries concurrently")
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        return list(executor.map(_post_graphql, queries))
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+def _cache_path(key: tuple) -> Path:
+    digest = hashlib.sha1(json.dumps(key).encode()).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def _cache_get(key: tuple) -> Optional[Any]:
+    """Return the cached value for ``key``, or None if missing or expired."""
+    path = _cache_path(key)
+    try:
+        with path.open() as fp:
+            entry = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("expires", 0) < time.time():
+        # Drop stale entries so old months do not pile up in CACHE_DIR
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+    return entry.get("data")
+
+
+def _cache_put(key: tuple, data: Any, ttl: float = MENU_CACHE_TTL) -> None:
+    path = _cache_path(key)
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Unique temp file per writer, then an atomic rename into place
+        with tempfile.NamedTemporaryFile(
+            "w", dir=CACHE_DIR, suffix=".tmp", delete=False
+        ) as fp:
+            tmp_name = fp.name
+            json.dump({"expires": time.time() + ttl, "data": data}, fp)
+        os.replace(tmp_name, path)
+    except OSError as e:
+        logger.warning(f"Unable to write menu cache {path}: {e}")
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+# Per-process memos for lookups that only change when the district is
+# reconfigured. Kept as plain dicts so a cold render can tell which lookups
+# miss and send them together in one batch.
+_DistrictSites = Tuple[str, Tuple[Tuple[str, str], ...]]  # (org name, ((id, name), ...))
+_DISTRICT_SITES: Dict[str, _DistrictSites] = {}
+_MENU_TYPE_IDS: Dict[tuple, Tuple[str, float]] = {}  # key -> (menuType id, fetched at)
+
+
+def _organization_query(district_id: str) -> str:
+    """Lightweight query that enumerates top-level sites for the org."""
+    return f"{{  organization(id:{_gql_str(district_id)}) {{ id name sites {{ id name }} }}}}"
+
+
+def _district_sites(district_id: str, data: Optional[dict]) -> _DistrictSites:
+    """Memoize the ``organization`` payload as (name, ((id, name), ...))."""
     if not data:
         raise ValueError(
             f"Organization (district) with id {district_id} not found. "
             "Please verify your District ID is correct."
         )
-    schools = data.get("sites") or []
-    school_ids = {s.get("id") for s in schools}
-    if school_id not in school_ids:
-        available = [f"{s.get('id')} ({s.get('name')})" for s in schools]
+    sites = tuple((s.get("id"), s.get("name")) for s in data.get("sites") or [])
+    org = _DISTRICT_SITES[district_id] = (data.get("name", district_id), sites)
+    return org
+
+
+def _validate_site_in_district(district_id: str, school_id: str, org: _DistrictSites) -> None:
+    """Raise ValueError if the school_id is not part of the district."""
+    org_name, sites = org
+    if school_id not in {site_id for site_id, _ in sites}:
+        available = [f"{site_id} ({name})" for site_id, name in sites]
         raise ValueError(
-            f"School id {school_id} not found in organization '{data.get('name', district_id)}'. "
+            f"School id {school_id} not found in organization '{org_name}'. "
             f"Available sites: {available}"
         )
 
 
-def fetch_menu_items(
-    district_id: str, site_id: str, menu_name: str, school_site_id: str = "", publish_location: str = "website"
-) -> Dict[str, List[str]]:
-    """Return mapping date -> list of product names for the current published month.
-
-    Parameters
-    ----------
-    district_id: str
-        ID of the district (e.g., 1212122355243477)
-    site_id: str
-        ID of the school (e.g., 894) - corresponds to siteCode/depth_0_id
-    menu_name : str
-        Human-readable menu name (e.g. "Lunch Elementary Schools").
-    school_site_id : str
-        Optional sub-site ID (e.g., 1237) - corresponds to siteCode2/depth_1_id
-    publish_location : str
-        The location where the menu is published (e.g. "website").
-
-    Returns
-    -------
-    dict[str, list[str]]
-        ISO date (YYYY-MM-DD) keys in chronological order, each value a list of item names.
-    """
-    if district_id:
-        _validate_site_in_district(district_id, site_id)
-
+def _menu_types_query(site_id: str, school_site_id: str, publish_location: str) -> str:
     # Build site input with depth_0 and optionally depth_1
     if school_site_id:
-        site_input = "{" + f'depth_0_id:"{site_id}", depth_1_id:"{school_site_id}"' + "}"
+        site_input = f"{{depth_0_id:{_gql_str(site_id)}, depth_1_id:{_gql_str(school_site_id)}}}"
     else:
-        site_input = "{" + f'depth_0_id:"{site_id}"' + "}"
-
-    # 1. Fetch menuTypes for site to resolve name -> menuType id
-    query_menu_types = (
+        site_input = f"{{depth_0_id:{_gql_str(site_id)}}}"
+    return (
         "{"
-        f'  menuTypes(site:{site_input}, publish_location:"{publish_location}") {{ id name }}'
+        f"  menuTypes(site:{site_input}, publish_location:{_gql_str(publish_location)}) {{ id name }}"
         "}"
     )
-    mt_data = _post_graphql(query_menu_types)
-    menu_types = mt_data.get("menuTypes") or []
+
+
+def _match_menu_type(menu_types: List[dict], site_id: str, menu_name: str) -> str:
+    """Return the id of the menu type whose name matches ``menu_name``."""
     if not menu_types:
         raise ValueError(
             f"No menu types found for site {site_id}. "
@@ -146,16 +293,19 @@ def fetch_menu_items(
             "or the School ID is incorrect."
         )
 
+    # Normalize each name once; duplicates are kept so ambiguity is detected
+    by_norm: Dict[str, List[dict]] = defaultdict(list)
+    for mt in menu_types:
+        by_norm[_normalize_name(mt.get("name", ""))].append(mt)
+
     target = _normalize_name(menu_name)
-    exact = [mt for mt in menu_types if _normalize_name(mt.get("name", "")) == target]
+    exact = by_norm.get(target, [])
     if len(exact) == 1:
         menu_type_id = exact[0]["id"]
     elif len(exact) > 1:
         raise ValueError(f"Ambiguous menu name '{menu_name}' (multiple exact matches)")
     else:
-        partial = [
-            mt for mt in menu_types if target in _normalize_name(mt.get("name", ""))
-        ]
+        partial = [mt for norm, mts in by_norm.items() if target in norm for mt in mts]
         if len(partial) == 1:
             menu_type_id = partial[0]["id"]
         elif not partial:
@@ -166,50 +316,175 @@ def fetch_menu_items(
             raise ValueError(
                 f"Ambiguous menu name '{menu_name}'. Candidates: {[mt.get('name') for mt in partial]}"
             )
+    return menu_type_id
+
+
+def _resolve_site_and_menu_type(
+    district_id: str, site_id: str, menu_name: str, school_site_id: str, publish_location: str
+) -> str:
+    """Validate ``site_id`` against the district and return the menuType id.
+
+    Both lookups are memoized in-process; on a cold call whichever of them
+    misses is sent in a single batched request. The menuType id is trusted
+    for MENU_TYPES_CACHE_TTL seconds from when the menuTypes list was fetched
+    from the server, whether it was then read from memory or from disk.
+    """
+    now = time.time()
+    queries: List[str] = []
+
+    org = _DISTRICT_SITES.get(district_id) if district_id else None
+    if district_id and org is None:
+        queries.append(_organization_query(district_id))
+
+    memo_key = (site_id, menu_name, school_site_id, publish_location)
+    memo = _MENU_TYPE_IDS.get(memo_key)
+    menu_type_id = memo[0] if memo and now - memo[1] < MENU_TYPES_CACHE_TTL else None
+    menu_types_entry = None
+    if menu_type_id is None:
+        query_menu_types = _menu_types_query(site_id, school_site_id, publish_location)
+        # The query text is part of the cache key so a change to it
+        # invalidates old entries. Entries are {"fetched_at": ..., "menuTypes": [...]}.
+        menu_types_key = ("menuTypes", query_menu_types)
+        menu_types_entry = _cache_get(menu_types_key)
+        if not isinstance(menu_types_entry, dict):
+            menu_types_entry = None
+            queries.append(query_menu_types)
+
+    results = iter(_post_graphql_batch(queries) if queries else [])
+    if district_id:
+        if org is None:
+            org = _district_sites(district_id, next(results).get("organization"))
+        _validate_site_in_district(district_id, site_id, org)
+
+    if menu_type_id is None:
+        if menu_types_entry is None:
+            menu_types_entry = {
+                "fetched_at": now,
+                "menuTypes": next(results).get("menuTypes") or [],
+            }
+            if menu_types_entry["menuTypes"]:
+                _cache_put(menu_types_key, menu_types_entry, ttl=MENU_TYPES_CACHE_TTL)
+        menu_type_id = _match_menu_type(menu_types_entry["menuTypes"], site_id, menu_name)
+        _MENU_TYPE_IDS[memo_key] = (menu_type_id, menu_types_entry["fetched_at"])
+    return menu_type_id
+
+
+def fetch_menu_items(
+    district_id: str,
+    site_id: str,
+    menu_name: str,
+    school_site_id: str = "",
+    publish_location: str = "website",
+    date_filter: Optional[Set[str]] = None,
+) -> Tuple[Dict[str, List[str]], bool]:
+    """Return mapping date -> list of product names for the current published month.
+
+    Parameters
+    ----------
+    district_id: str
+        ID of the district (e.g., 1212122355243477)
+    site_id: str
+        ID of the school (e.g., 894) - corresponds to siteCode/depth_0_id
+    menu_name : str
+        Human-readable menu name (e.g. "Lunch Elementary Schools").
+    school_site_id : str
+        Optional sub-site ID (e.g., 1237) - corresponds to siteCode2/depth_1_id
+    publish_location : str
+        The location where the menu is published (e.g. "website").
+    date_filter : set[str], optional
+        ISO dates to keep. Items for any other date are skipped.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        ISO date (YYYY-MM-DD) keys in chronological order, each value a list of item names.
+    bool
+        Whether any fetched month had items, before ``date_filter`` was applied.
+    """
+    # 1. Validate the school and resolve menu name -> menuType id
+    menu_type_id = _resolve_site_and_menu_type(
+        district_id, site_id, menu_name, school_site_id, publish_location
+    )
 
     # 2. Fetch menu items for current (and possibly next) month
     # We bypass defaultPublishedMonth to ensure we get the relevant dates.
-    today = date.today()
-    # 0-indexed month for GraphQL
-    months_to_fetch = [(today.month - 1, today.year)]
-
-    # If late in the month, fetch next month too to ensure coverage
-    if today.day > 20:
-        # Calculate next month safely
-        if today.month == 12:
-            months_to_fetch.append((0, today.year + 1))
-        else:
-            months_to_fetch.append((today.month, today.year))
-
-    by_date: Dict[str, List[str]] = {}
+    if date_filter is not None:
+        # The current month plus any month the requested dates fall in
+        # (0-indexed for GraphQL); usually just the current one. The current
+        # month is always included so an unpublished next month still counts
+        # as published overall.
+        months = {date.fromisoformat(iso).replace(day=1) for iso in date_filter}
+        months.add(date.today().replace(day=1))
+        months_to_fetch = [(d.month - 1, d.year) for d in sorted(months)]
+    else:
+        today = date.today()
+        # 0-indexed month for GraphQL
+        months_to_fetch = [(today.month - 1, today.year)]
+
+        # If late in the month, fetch next month too to ensure coverage
+        if today.day > 20:
+            # Calculate next month safely
+            if today.month == 12:
+                months_to_fetch.append((0, today.year + 1))
+            else:
+                months_to_fetch.append((today.month, today.year))
+
+    by_date: Dict[str, List[str]] = defaultdict(list)
+    published = False
+
+    def menu_cache_key(m_idx: int, year_val: int) -> tuple:
+        return (
+            "menu",
+            district_id,
+            site_id,
+            menu_type_id,
+            m_idx,
+            year_val,
+            MENU_ITEMS_SELECTION,
+        )
 
+    items_by_month: Dict[tuple, list] = {}
+    missing = []
     for m_idx, year_val in months_to_fetch:
-        query_menu = (
-            "{"
-            f'  menuType(id:"{menu_type_id}") {{ menu(month:{m_idx}, year:{year_val}) {{ items {{ day month year product {{ name }} }} }} }}'
-            "}"
+        cached = _cache_get(menu_cache_key(m_idx, year_val))
+        if cached is None:
+            missing.append((m_idx, year_val))
+        else:
+            items_by_month[(m_idx, year_val)] = cached
+
+    if missing:
+        # One aliased menuType query (m0, m1, ...) covers every month we need.
+        month_fields = " ".join(
+            f"m{i}: menu(month:{int(m_idx)}, year:{int(year_val)}) {{ {MENU_ITEMS_SELECTION} }}"
+            for i, (m_idx, year_val) in enumerate(missing)
         )
+        query_menu = "{" f"  menuType(id:{_gql_str(menu_type_id)}) {{ {month_fields} }}" "}"
         mt_data = _post_graphql(query_menu).get("menuType") or {}
-        menu_payload = mt_data.get("menu") or {}
-        items = menu_payload.get("items") or []
+        for i, (m_idx, year_val) in enumerate(missing):
+            items = (mt_data.get(f"m{i}") or {}).get("items") or []
+            items_by_month[(m_idx, year_val)] = items
+            # Unpublished months are not cached so they show up promptly
+            if items:
+                _cache_put(menu_cache_key(m_idx, year_val), items)
 
-        for it in items:
-            # Month resolution
-            raw_item_month = it.get("month")
-            if isinstance(raw_item_month, int):
-                month_num = raw_item_month + 1
-            else:
-                month_num = m_idx + 1
-
-            item_year = it.get("year") or year_val
+    for m_idx, year_val in months_to_fetch:
+        items = items_by_month[(m_idx, year_val)]
+        # Items belong to the month/year they were queried with
+        month_num = m_idx + 1
 
+        for it in items:
             day_raw = it.get("day")
             try:
                 day_int = int(day_raw)
             except (ValueError, TypeError):
                 continue
 
-            date_key = f"{item_year}-{month_num:02d}-{day_int:02d}"
+            date_key = f"{year_val}-{month_num:02d}-{day_int:02d}"
+            in_window = date_filter is None or date_key in date_filter
+            # Items outside the window only matter until one proves the menu
+            # is published
+            if not in_window and published:
+                continue
             prod = it.get("product") or {}
             name = prod.get("name")
             if not name:
@@ -218,15 +493,13 @@ def fetch_menu_items(
             norm_name = _normalize_name(name)
             if norm_name in COMMON_MENU_ITEM_FILTER:
                 continue
-            by_date.setdefault(date_key, []).append(name)
+            published = True
+            if in_window:
+                by_date[date_key].append(name)
 
-    # Ensure chronological ordering (Python preserves insertion order)
-    ordered: Dict[str, List[str]] = {}
-    for k in sorted(by_date):
-        ordered[k] = by_date[k]
-    # Drop any dates that became empty after filtering
-    filtered = {k: v for k, v in ordered.items() if v}
-    return filtered
+    # Ensure chronological ordering (Python preserves insertion order). Only
+    # kept names are ever appended, so no date maps to an empty list.
+    return {k: by_date[k] for k in sorted(by_date)}, published
 
 
 # ---------------------------------------------------------------------------
@@ -249,6 +522,9 @@ class ParsedSettings:
 
 
 class SchoolMenu(BasePlugin):
+    # (render key, image) of the last reusable render
+    _last_render: Optional[Tuple[str, Any]] = None
+
     def generate_settings_template(self):  # type: ignore[override]
         params = super().generate_settings_template()
         params["style_settings"] = "True"
@@ -261,6 +537,8 @@ class SchoolMenu(BasePlugin):
         cfg = self._parse_settings(settings)
         logger.debug("Parsed settings: %s", cfg)
 
+        target_days = self._next_school_days(cfg.days)
+
         # Fetch menu data via GraphQL. If it fails, fallback to placeholder.
         fetch_ok = True
         try:
@@ -268,15 +546,19 @@ class SchoolMenu(BasePlugin):
             logger.info(
                 f"Fetching menu: district={cfg.district_id}, school={cfg.school_id}, school_site={cfg.school_site_id}, menu={cfg.menu_name}"
             )
-            all_items = fetch_menu_items(
+            all_items, published = fetch_menu_items(
                 cfg.district_id,
                 cfg.school_id,
                 cfg.menu_name,
                 cfg.school_site_id,
+                date_filter={d.isoformat() for d in target_days},
             )
             logger.info(f"Successfully fetched {len(all_items)} dates from GraphQL")
-            # If fetch succeeded but returned no items, treat as no menu published
-            if not all_items:
+            # If fetch succeeded but the fetched months had no items, treat as no
+            # menu published. Items that merely fall outside the upcoming window
+            # (weekend before a new month is published, school breaks) leave
+            # fetch_ok set so those days show as pending.
+            if not published:
                 logger.warning("Fetch succeeded but returned no menu items")
                 fetch_ok = False
                 today_iso = date.today().isoformat()
@@ -290,7 +572,6 @@ class SchoolMenu(BasePlugin):
             all_items = {today_iso: [NO_MENU_TEXT]}
 
         # Filter upcoming school days
-        target_days = self._next_school_days(cfg.days)
         menu_subset: Dict[str, List[str]] = {}
         for d in target_days:
             iso = d.isoformat()
@@ -305,16 +586,17 @@ class SchoolMenu(BasePlugin):
 
         # Build template parameters
         tz_now = datetime.now()
-        day_names = {
-            iso: datetime.fromisoformat(iso).strftime("%A") for iso in menu_subset
-        }
-        formatted_dates = {
-            iso: datetime.fromisoformat(iso).strftime("%b %d") for iso in menu_subset
-        }
+        parsed: Dict[str, date] = {}
+        day_names: Dict[str, str] = {}
+        formatted_dates: Dict[str, str] = {}
+        for iso in menu_subset:
+            dt = parsed[iso] = date.fromisoformat(iso)
+            day_names[iso] = dt.strftime("%A")
+            formatted_dates[iso] = dt.strftime("%b %d")
         single_date_text = ""  # Only used when one day and show_date
         if len(menu_subset) == 1:
             only_iso = next(iter(menu_subset))
-            single_date_text = datetime.fromisoformat(only_iso).strftime("%A, %B %d")
+            single_date_text = parsed[only_iso].strftime("%A, %B %d")
 
         dimensions = device_config.get_resolution()
         if device_config.get_config("orientation") == "vertical":
@@ -339,9 +621,28 @@ class SchoolMenu(BasePlugin):
             "font_scale": cfg.font_scale,
         }
 
+        # Rendering is the expensive step; reuse the last image when nothing
+        # that ends up on screen has changed. A displayed refresh timestamp
+        # changes every render, so caching is skipped entirely in that case.
+        render_key = None
+        if not cfg.show_timestamp:
+            key_params = {k: v for k, v in template_params.items() if k != "timestamp"}
+            render_key = hashlib.sha256(
+                json.dumps(
+                    {"dims": list(dimensions), "params": key_params},
+                    sort_keys=True,
+                    default=str,
+                ).encode()
+            ).hexdigest()
+            if self._last_render and self._last_render[0] == render_key:
+                logger.debug("Menu unchanged since last render; reusing image")
+                return self._last_render[1].copy()
+
         image = self.render_image(dimensions, "menu.html", "menu.css", template_params)
         if not image:
             raise RuntimeError("Failed to render SchoolMenu image.")
+        # Only hold on to an image that can actually be reused
+        self._last_render = (render_key, image.copy()) if render_key else None
         return image
 
     # ------------------------------------------------------------------
@@ -399,13 +700,11 @@ class SchoolMenu(BasePlugin):
         )
 
     def _next_school_days(self, n: int) -> List[date]:
-        out: List[date] = []
-        cur = date.today()
-        while len(out) < n:
-            if cur.weekday() < 5:  # Monday-Friday
-                out.append(cur)
-            cur += timedelta(days=1)
-        return out
+        today = date.today()
+        # n weekdays always fit in n calendar days plus one weekend per 5 days
+        span = n + 2 * ((n + 4) // 5)
+        candidates = (today + timedelta(days=k) for k in range(span))
+        return [d for d in candidates if d.weekday() < 5][:n]  # Monday-Friday
 
 
 __all__ = ["SchoolMenu"]
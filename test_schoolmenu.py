@@ -0,0 +1,80 @@
+"""Equivalence checks for the optimized helpers in schoolmenu.py.
+
+Run from InkyPi's ``src`` directory (or with it on ``PYTHONPATH``) so that
+``plugins.base_plugin`` is importable; otherwise the module is skipped.
+"""
+
+import random
+import re
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("plugins.base_plugin.base_plugin")
+import schoolmenu  # noqa: E402
+
+
+def _reference_normalize(name: str) -> str:
+    """Original implementation the filter set was written against."""
+    return re.sub(r"\s+", " ", name.strip().lower())
+
+
+def _reference_school_days(start: date, n: int):
+    """Original day-by-day loop."""
+    out = []
+    cur = start
+    while len(out) < n:
+        if cur.weekday() < 5:
+            out.append(cur)
+        cur += timedelta(days=1)
+    return out
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "Non-fat Milk",
+        "  Non-fat   milk ",
+        "Garden\tBar:",
+        "Straus Organic\n1% Milk",
+        "Pizza\x0bDay\x1f",
+        "Crème\xa0Brûlée",
+        "Straße",
+        "İstanbul Kebab",
+        "Rice　Bowl",
+        "",
+    ],
+)
+def test_normalize_name_examples(name):
+    assert schoolmenu._normalize_name(name) == _reference_normalize(name)
+
+
+def test_normalize_name_matches_reference_randomized():
+    alphabet = [chr(c) for c in range(128)] + ["\xa0", "É", "ß", "　", "İ", " "]
+    rng = random.Random(0)
+    for _ in range(20000):
+        name = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+        assert schoolmenu._normalize_name(name) == _reference_normalize(name), repr(name)
+
+
+def test_common_filter_matches_normalized_names():
+    assert isinstance(schoolmenu.COMMON_MENU_ITEM_FILTER, frozenset)
+    for item in schoolmenu.COMMON_MENU_ITEM_FILTER:
+        assert schoolmenu._normalize_name(item) == item
+    assert schoolmenu._normalize_name(" Non-Fat\t Milk") in schoolmenu.COMMON_MENU_ITEM_FILTER
+
+
+@pytest.mark.parametrize("offset", range(14))
+def test_next_school_days_matches_loop(monkeypatch, offset):
+    start = date(2026, 10, 26) + timedelta(days=offset)  # covers every weekday and a month end
+
+    class FixedDate(date):
+        @classmethod
+        def today(cls):
+            return cls(start.year, start.month, start.day)
+
+    monkeypatch.setattr(schoolmenu, "date", FixedDate)
+    for n in range(1, 12):
+        days = schoolmenu.SchoolMenu._next_school_days(None, n)
+        assert days == _reference_school_days(start, n)
+        assert all(d.weekday() < 5 for d in days)